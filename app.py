@@ -1,6 +1,9 @@
 import os
 import django
 import uuid
+import functools
+import inspect
+from typing import Awaitable, Callable
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'myproject.settings')
 django.setup()
@@ -10,62 +13,89 @@ from nicegui import ui
 from models import User
 from ui.login_form import render_login_form
 from ui.pool_form import render_pool_form
-from ui.submissions_dashboard import render_submissions_dashboard
-from services.auth import get_current_user
+from ui.submissions_dashboard import (
+    PREWARM_INTERVAL_SECONDS,
+    prewarm_submissions_cache,
+    render_submissions_dashboard,
+)
+from services.auth import AuthenticationService, get_current_user
 import logging
+from config.app_config import PREWARM_DASHBOARD_CACHE
 from config.logging_config import setup_logging
-from config.app_config import get_route, get_navigation_path
+from ui.navigation import (
+    ROUTE_LOGIN,
+    ROUTE_POOL,
+    ROUTE_SUBMISSIONS,
+    ROUTE_FORM_NEW,
+    ROUTE_FORM_VIEW,
+)
 from nicegui import app
 
 setup_logging()
 logger = logging.getLogger(__name__)
-logged_in_user: dict[str, User | None] = {'user': None}
 
-def set_logged_in_user(user: User) -> None:
-    logged_in_user['user'] = user
-    app.storage.user['user_id'] = user.id
+if PREWARM_DASHBOARD_CACHE:
+    # Starts with the app and keeps the prewarmed pages from expiring
+    app.timer(PREWARM_INTERVAL_SECONDS, prewarm_submissions_cache)
 
-@ui.page(get_route('/'))
+@ui.page(ROUTE_LOGIN)
 def login_page() -> None:
-    render_login_form(set_logged_in_user)
-
-
-@ui.page(get_route('/pool'))
-async def pool_page() -> None:
-    if logged_in_user['user']:
-        await render_pool_form(logged_in_user['user'])
-    else:
-        ui.label('Lütfen önce giriş yapın')
-        ui.link('Girişe git', get_navigation_path('/'))
-
-@ui.page(get_route('/submissions'))
-async def submissions_page() -> None:
-    if logged_in_user['user']:
-        await render_submissions_dashboard(logged_in_user['user'])
-    else:
-        ui.label('Lütfen önce giriş yapın')
-        ui.link('Girişe git', get_navigation_path('/'))
-
-@ui.page(get_route('/form'))
-async def new_form_page() -> None:
-    if logged_in_user['user']:
-        await render_pool_form(logged_in_user['user'])
-    else:
-        ui.label('Lütfen önce giriş yapın')
-        ui.link('Girişe git', get_navigation_path('/'))
-
-@ui.page(get_route('/form/{ref_id}'))
-async def form_page(ref_id: str):
-    # Get the current logged-in user
-    user = await get_current_user()
-
-    # Authentication Guard
-    if not user:
-        ui.label('Bu formu görüntülemek için lütfen giriş yapın.')
-        ui.navigate.to(get_navigation_path('/'))
-        return
-
-    # Render the Form Component
+    render_login_form(AuthenticationService.store_user_session)
+
+
+def redirect_to_login() -> None:
+    """Tell an anonymous visitor to log in and send them to the login page."""
+    ui.label('Lütfen önce giriş yapın')
+    ui.navigate.to(ROUTE_LOGIN)
+
+
+def require_login(handler: Callable[..., Awaitable[None]]) -> Callable[..., Awaitable[None]]:
+    """
+    Guard a page handler behind the session login.
+
+    The wrapped handler receives the authenticated User as its first argument;
+    anonymous visitors are sent back to the login page instead.
+
+    Args:
+        handler: Page coroutine taking the user followed by its route parameters
+
+    Returns:
+        The guarded page coroutine
+    """
+    @functools.wraps(handler)
+    async def wrapper(*args, **kwargs) -> None:
+        user = await get_current_user()
+        if not user:
+            redirect_to_login()
+            return
+        await handler(user, *args, **kwargs)
+
+    # NiceGUI injects route parameters based on the signature, so hide `user`
+    signature = inspect.signature(handler)
+    wrapper.__signature__ = signature.replace(
+        parameters=list(signature.parameters.values())[1:]
+    )
+    return wrapper
+
+
+@ui.page(ROUTE_POOL)
+@require_login
+async def pool_page(user: User) -> None:
+    await render_pool_form(user)
+
+@ui.page(ROUTE_SUBMISSIONS)
+@require_login
+async def submissions_page(user: User) -> None:
+    await render_submissions_dashboard(user)
+
+@ui.page(ROUTE_FORM_NEW)
+@require_login
+async def new_form_page(user: User) -> None:
+    await render_pool_form(user)
+
+@ui.page(ROUTE_FORM_VIEW)
+@require_login
+async def form_page(user: User, ref_id: str) -> None:
     await render_pool_form(user, reading_ref_id=ref_id)
 
 if __name__ in {"__main__", "__mp_main__"}:
@@ -8,6 +8,13 @@ PATH_PREFIX = os.getenv('PATH_PREFIX', '')
 # Remove trailing slash if present
 PATH_PREFIX = PATH_PREFIX.rstrip('/')
 
+# Remember successful password checks for a short window so repeat logins skip
+# the PBKDF2 work; off by default since it keeps password digests in memory
+AUTH_VERIFY_CACHE = os.getenv('AUTH_VERIFY_CACHE', '').lower() in {'1', 'true', 'yes'}
+
+# Fill the submissions dashboard cache for the busiest users at startup
+PREWARM_DASHBOARD_CACHE = os.getenv('PREWARM_DASHBOARD_CACHE', '').lower() in {'1', 'true', 'yes'}
+
 def get_route(path: str) -> str:
     """
     Get the full route path with prefix.
@@ -21,9 +28,7 @@ def get_route(path: str) -> str:
     if not path.startswith('/'):
         path = f'/{path}'
 
-    if PATH_PREFIX:
-        return f'{PATH_PREFIX}{path}'
-    return path
+    return f'{PATH_PREFIX}{path}' if PATH_PREFIX else path
 
 
 def get_navigation_path(path: str) -> str:
@@ -1,20 +1,37 @@
+import atexit
 import logging
+import os
+import queue
 import sys
+from logging.handlers import QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Optional
 
 # Create logs directory
 LOGS_DIR = Path(__file__).parent.parent / 'logs'
 LOGS_DIR.mkdir(exist_ok=True)
 
+# Verbosity of the root logger and app.log; set LOG_LEVEL=DEBUG when developing
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+
+DETAILED_FORMAT = '[%(asctime)s] %(levelname)s [%(name)s:%(lineno)s] %(message)s'
+DETAILED_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+LOG_FILE_MAX_BYTES = 10485760  # 10MB
+LOG_FILE_BACKUP_COUNT = 5
+
+# Give each process its own log files (app.<pid>.log) so several workers never
+# rotate the same file underneath each other
+LOG_FILE_PER_PROCESS = os.getenv('LOG_FILE_PER_PROCESS', '').lower() in {'1', 'true', 'yes'}
+
+# Records bound for the log files are handed to a background listener thread
+# so file writes never block the event loop
+LOG_QUEUE: queue.Queue = queue.Queue(-1)
+
 # Logging configuration
 LOGGING_CONFIG = {
     'version': 1,
     'disable_existing_loggers': False,
     'formatters': {
-        'detailed': {
-            'format': '[%(asctime)s] %(levelname)s [%(name)s:%(lineno)s] %(message)s',
-            'datefmt': '%Y-%m-%d %H:%M:%S'
-        },
         'simple': {
             'format': '%(levelname)s - %(message)s'
         }
@@ -26,37 +43,66 @@ LOGGING_CONFIG = {
             'formatter': 'simple',
             'stream': sys.stdout
         },
-        'file': {
-            'class': 'logging.handlers.RotatingFileHandler',
-            'level': 'DEBUG',
-            'formatter': 'detailed',
-            'filename': LOGS_DIR / 'app.log',
-            'maxBytes': 10485760,  # 10MB
-            'backupCount': 5
-        },
-        'error_file': {
-            'class': 'logging.handlers.RotatingFileHandler',
-            'level': 'ERROR',
-            'formatter': 'detailed',
-            'filename': LOGS_DIR / 'error.log',
-            'maxBytes': 10485760,  # 10MB
-            'backupCount': 5
+        'queue': {
+            'class': 'logging.handlers.QueueHandler',
+            'level': LOG_LEVEL,
+            'queue': LOG_QUEUE
         }
     },
     'loggers': {
         '': {  # Root logger
-            'handlers': ['console', 'file', 'error_file'],
-            'level': 'DEBUG',
+            'handlers': ['console', 'queue'],
+            'level': LOG_LEVEL,
             'propagate': True
         },
         'django': {
-            'handlers': ['console', 'file'],
+            'handlers': ['console', 'queue'],
             'level': 'INFO',
             'propagate': False
         }
     }
 }
 
+_listener: Optional[QueueListener] = None
+
+# Shared by every file handler instead of building one per handler
+_detailed_formatter = logging.Formatter(DETAILED_FORMAT, DETAILED_DATE_FORMAT)
+
+
+def _log_file_path(name: str) -> Path:
+    """Get the path of a log file, suffixed with the PID when per-process files are enabled."""
+    if LOG_FILE_PER_PROCESS:
+        return LOGS_DIR / f'{name}.{os.getpid()}.log'
+    return LOGS_DIR / f'{name}.log'
+
+
+def _create_file_handler(name: str, level: int | str) -> RotatingFileHandler:
+    """Create a rotating file handler using the detailed format."""
+    handler = RotatingFileHandler(
+        _log_file_path(name),
+        maxBytes=LOG_FILE_MAX_BYTES,
+        backupCount=LOG_FILE_BACKUP_COUNT
+    )
+    handler.setLevel(level)
+    handler.setFormatter(_detailed_formatter)
+    return handler
+
+
+def _start_queue_listener() -> None:
+    """Start the background listener that writes queued records to the log files."""
+    global _listener
+    if _listener is not None:
+        return
+
+    _listener = QueueListener(
+        LOG_QUEUE,
+        _create_file_handler('app', LOG_LEVEL),
+        _create_file_handler('error', logging.ERROR),
+        respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(_listener.stop)
+
 
 def setup_logging() -> logging.Logger:
     """
@@ -67,4 +113,5 @@ def setup_logging() -> logging.Logger:
     """
     from logging.config import dictConfig
     dictConfig(LOGGING_CONFIG)
+    _start_queue_listener()
     return logging.getLogger(__name__)
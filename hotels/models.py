@@ -8,8 +8,5 @@ class Hotel(models.Model):
     email = models.EmailField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
-    class Meta:
-        ordering = ['name']
-
     def __str__(self) -> str:
         return self.name
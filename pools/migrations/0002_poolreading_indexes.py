@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-15 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        ('hotels', '0001_initial'),
+        ('pools', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='poolreading',
+            index=models.Index(fields=['hotel', '-submission_date'], name='pools_reading_hotel_date_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 6.0 on 2026-10-15 09:30
+
+import django.contrib.postgres.functions
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pools', '0002_poolreading_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='poolreading',
+            name='reference_id',
+            field=models.CharField(blank=True, db_default=django.db.models.functions.comparison.Cast(django.contrib.postgres.functions.RandomUUID(), output_field=models.CharField()), editable=False, max_length=500, unique=True),
+        ),
+    ]
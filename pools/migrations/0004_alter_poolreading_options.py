@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-15 10:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pools', '0003_poolreading_reference_id_db_default'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='poolreading',
+            options={},
+        ),
+    ]
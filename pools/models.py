@@ -1,6 +1,7 @@
+from django.contrib.postgres.functions import RandomUUID
 from django.db import models
+from django.db.models.functions import Cast
 from accounts.models import User
-from datetime import datetime
 
 
 class PoolReading(models.Model):
@@ -30,7 +31,14 @@ class PoolReading(models.Model):
         choices=WaterClarity.choices,
     )
     notes = models.TextField(blank=True, null=True)
-    reference_id = models.CharField(max_length=500, unique=True, editable=False, blank=True)
+    # Generated by PostgreSQL on INSERT and returned in the same round-trip
+    reference_id = models.CharField(
+        max_length=500,
+        unique=True,
+        editable=False,
+        blank=True,
+        db_default=Cast(RandomUUID(), output_field=models.CharField()),
+    )
     status = models.CharField(
         max_length=20,
         choices=Status.choices,
@@ -38,14 +46,9 @@ class PoolReading(models.Model):
     )
 
     class Meta:
-        ordering = ['-submission_date']
-
-    def save(self, *args, **kwargs) -> None:
-        # Auto-generate reference_id: HOTELNAME__USERNAME__DATETIME
-        if not self.reference_id:
-            timestamp = self.submission_date.strftime('%Y%m%d_%H%M%S') if self.submission_date else datetime.now().strftime('%Y%m%d_%H%M%S')
-            self.reference_id = f"{self.hotel.name}__{self.submitted_by.username}__{timestamp}"
-        super().save(*args, **kwargs)
+        indexes = [
+            models.Index(fields=['hotel', '-submission_date'], name='pools_reading_hotel_date_idx'),
+        ]
 
     def __str__(self) -> str:
         return f"{self.hotel.name} - {self.submission_date.strftime('%Y-%m-%d')}"
@@ -1,12 +1,17 @@
 """Authentication and user management service."""
 
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Optional
+import hashlib
 import logging
+import secrets
+import time
 
 from django.contrib.auth.hashers import check_password
-from pydantic import BaseModel
 from nicegui import app
 
+from config.app_config import AUTH_VERIFY_CACHE
 from models import User
 
 
@@ -15,17 +20,30 @@ logger = logging.getLogger(__name__)
 
 # Constants
 SESSION_USER_ID_KEY = 'user_id'
+USER_CACHE_TTL_SECONDS = 30
+USER_CACHE_MAX_SIZE = 1024
 
+PASSWORD_CACHE_TTL_SECONDS = 300
+PASSWORD_CACHE_MAX_SIZE = 256
 
-class AuthenticationResult(BaseModel):
+# Authenticated users keyed by id, with the monotonic time they were loaded,
+# least recently used first
+_user_cache: OrderedDict[int, tuple[float, User]] = OrderedDict()
+
+# Successful (password hash, keyed password digest) checks, oldest first. The
+# digest key is random per process, so entries are useless outside it, and a
+# password change alters the hash so old entries can no longer match.
+_password_digest_key = secrets.token_bytes(32)
+_verified_passwords: OrderedDict[tuple[str, str], float] = OrderedDict()
+
+
+@dataclass(slots=True)
+class AuthenticationResult:
     """Result of an authentication attempt."""
     success: bool
     message: str
     user: Optional[User] = None
 
-    class Config:
-        arbitrary_types_allowed = True
-
 
 class AuthenticationService:
     """Service for managing user authentication and sessions."""
@@ -52,11 +70,18 @@ class AuthenticationService:
             )
 
         try:
-            user = await User.objects.select_related('hotel').aget(
+            user = await User.objects.select_related('hotel').filter(
                 username=username
-            )
+            ).afirst()
 
-            if check_password(password, user.password_hash):
+            if user is None:
+                logger.warning(f"Authentication attempt for non-existent user: {username}")
+                return AuthenticationResult(
+                    success=False,
+                    message="Kullanıcı bulunamadı"
+                )
+
+            if AuthenticationService._verify_password(password, user.password_hash):
                 logger.info(f"Successful authentication for user: {username}")
                 return AuthenticationResult(
                     success=True,
@@ -70,13 +95,6 @@ class AuthenticationService:
                     message="Geçersiz şifre"
                 )
 
-        except User.DoesNotExist:
-            logger.warning(f"Authentication attempt for non-existent user: {username}")
-            return AuthenticationResult(
-                success=False,
-                message="Kullanıcı bulunamadı"
-            )
-
         except Exception as e:
             logger.error(f"Authentication error for {username}: {e}", exc_info=True)
             return AuthenticationResult(
@@ -84,6 +102,39 @@ class AuthenticationService:
                 message="Kimlik doğrulama sırasında bir hata oluştu"
             )
 
+    @staticmethod
+    def _verify_password(password: str, password_hash: str) -> bool:
+        """
+        Check a password against its hash, reusing recent successful checks.
+
+        Args:
+            password: The plaintext password to verify
+            password_hash: The stored Django password hash
+
+        Returns:
+            True if the password matches the hash
+        """
+        if not AUTH_VERIFY_CACHE:
+            return check_password(password, password_hash)
+
+        digest = hashlib.blake2b(
+            password.encode(), key=_password_digest_key, digest_size=16
+        ).hexdigest()
+        cache_key = (password_hash, digest)
+
+        verified_at = _verified_passwords.get(cache_key)
+        if verified_at is not None and time.monotonic() - verified_at < PASSWORD_CACHE_TTL_SECONDS:
+            return True
+
+        if not check_password(password, password_hash):
+            return False
+
+        _verified_passwords[cache_key] = time.monotonic()
+        _verified_passwords.move_to_end(cache_key)
+        if len(_verified_passwords) > PASSWORD_CACHE_MAX_SIZE:
+            _verified_passwords.popitem(last=False)
+        return True
+
     @staticmethod
     async def get_current_user() -> Optional[User]:
         """
@@ -92,34 +143,62 @@ class AuthenticationService:
         Returns:
             The authenticated User object, or None if not logged in
         """
-        user_id = app.storage.user.get(SESSION_USER_ID_KEY)
+        storage = app.storage.user
+        user_id = storage.get(SESSION_USER_ID_KEY)
 
         if not user_id:
             return None
 
+        cached = _user_cache.get(user_id)
+        if cached is not None:
+            cached_at, user = cached
+            if time.monotonic() - cached_at < USER_CACHE_TTL_SECONDS:
+                _user_cache.move_to_end(user_id)
+                return user
+            del _user_cache[user_id]
+
         try:
-            user = await User.objects.select_related('hotel').aget(id=user_id)
-            return user
+            user = await User.objects.select_related('hotel').filter(id=user_id).afirst()
 
-        except User.DoesNotExist:
-            logger.warning(f"Stale session detected for user_id={user_id}")
-            AuthenticationService.clear_session()
-            return None
+            if user is None:
+                logger.warning(f"Stale session detected for user_id={user_id}")
+                AuthenticationService.clear_session(storage)
+                return None
+
+            AuthenticationService._cache_user(user)
+            return user
 
         except Exception as e:
             logger.error(f"Error retrieving current user: {e}", exc_info=True)
             return None
 
+    @staticmethod
+    def _cache_user(user: User) -> None:
+        """Remember a loaded user, evicting the least recently used one when full."""
+        _user_cache[user.id] = (time.monotonic(), user)
+        _user_cache.move_to_end(user.id)
+        if len(_user_cache) > USER_CACHE_MAX_SIZE:
+            _user_cache.popitem(last=False)
+
     @staticmethod
     def store_user_session(user: User) -> None:
         """Store user ID in the session."""
+        AuthenticationService._cache_user(user)
         app.storage.user[SESSION_USER_ID_KEY] = user.id
-        logger.debug(f"Session created for user: {user.username}")
+        logger.debug("Session created for user: %s", user.username)
 
     @staticmethod
-    def clear_session() -> None:
-        """Clear the current user session."""
-        app.storage.user.clear()
+    def clear_session(storage: Optional[dict] = None) -> None:
+        """
+        Clear the current user session.
+
+        Args:
+            storage: The session storage, if the caller already resolved it
+        """
+        if storage is None:
+            storage = app.storage.user
+        _user_cache.pop(storage.get(SESSION_USER_ID_KEY), None)
+        storage.clear()
         logger.debug("Session cleared")
 
 
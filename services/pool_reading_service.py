@@ -1,5 +1,6 @@
 """Pool reading service for managing pool inspection submissions."""
 
+from dataclasses import dataclass, field
 from typing import Optional
 import logging
 
@@ -11,7 +12,12 @@ from models import User, PoolReading
 logger = logging.getLogger(__name__)
 
 
-class PoolReadingSubmissionResult(BaseModel):
+# Constants
+VALID_STATUSES = frozenset(PoolReading.Status.values)
+
+
+@dataclass(slots=True)
+class PoolReadingSubmissionResult:
     """
     Result of a pool reading submission operation.
 
@@ -24,10 +30,22 @@ class PoolReadingSubmissionResult(BaseModel):
     success: bool
     message: str
     reference_id: Optional[str] = None
-    reading: Optional[PoolReading] = Field(default=None, exclude=True)
+    reading: Optional[PoolReading] = None
 
-    class Config:
-        arbitrary_types_allowed = True
+
+@dataclass(slots=True)
+class PoolReadingBulkSubmissionResult:
+    """
+    Result of submitting several pool readings at once.
+
+    Attributes:
+        success: Whether all readings were stored
+        message: Human-readable message about the result
+        reference_ids: Reference IDs of the stored readings, in input order
+    """
+    success: bool
+    message: str
+    reference_ids: list[str] = field(default_factory=list)
 
 
 class PoolReadingData(BaseModel):
@@ -77,12 +95,10 @@ class PoolReadingService:
                             "Lütfen yöneticiyle iletişime geçin."
                 )
 
-            # Create the pool reading
+            # Create the pool reading; the database generates reference_id
+            # and returns it with the INSERT, so the instance is already complete
             reading = await PoolReadingService._create_reading(data, user)
 
-            # Refresh to get auto-generated fields
-            await reading.arefresh_from_db()
-
             logger.info(
                 f"Pool reading submitted successfully: {reading.reference_id} "
                 f"by user {user.username}"
@@ -116,18 +132,72 @@ class PoolReadingService:
             )
 
     @staticmethod
-    async def _create_reading(data: PoolReadingData, user: User) -> PoolReading:
+    async def bulk_submit_readings(
+        data_list: list[PoolReadingData],
+        user: User
+    ) -> PoolReadingBulkSubmissionResult:
         """
-        Create a new pool reading in the database.
+        Submit several pool readings in a single INSERT.
+
+        Args:
+            data_list: The pool reading data to submit
+            user: The user submitting the readings
+
+        Returns:
+            PoolReadingBulkSubmissionResult with success status and reference IDs
+        """
+        try:
+            # Validate user has associated hotel
+            if not user.hotel:
+                return PoolReadingBulkSubmissionResult(
+                    success=False,
+                    message="Kullanıcı bir otelle ilişkilendirilmemiş. "
+                            "Lütfen yöneticiyle iletişime geçin."
+                )
+
+            # reference_id is a database default, returned by the bulk INSERT
+            readings = await PoolReading.objects.abulk_create([
+                PoolReadingService._build_reading(data, user)
+                for data in data_list
+            ])
+            reference_ids = [reading.reference_id for reading in readings]
+
+            logger.info(
+                f"{len(readings)} pool readings submitted successfully "
+                f"by user {user.username}"
+            )
+
+            return PoolReadingBulkSubmissionResult(
+                success=True,
+                message=f"{len(readings)} havuz ölçümü başarıyla gönderildi.",
+                reference_ids=reference_ids
+            )
+
+        except Exception as e:
+            # Unexpected errors
+            logger.error(
+                f"Database error during bulk submission by {user.username}: {e}",
+                exc_info=True
+            )
+            return PoolReadingBulkSubmissionResult(
+                success=False,
+                message="Sistem hatası nedeniyle gönderim başarısız oldu. "
+                        "Lütfen daha sonra tekrar deneyin."
+            )
+
+    @staticmethod
+    def _build_reading(data: PoolReadingData, user: User) -> PoolReading:
+        """
+        Build an unsaved pool reading for the given user.
 
         Args:
             data: The pool reading data
             user: The user submitting the reading
 
         Returns:
-            The created PoolReading instance
+            The unsaved PoolReading instance
         """
-        return await PoolReading.objects.acreate(
+        return PoolReading(
             hotel=user.hotel,
             submitted_by=user,
             ph_level=data.ph_level,
@@ -139,6 +209,22 @@ class PoolReadingService:
             status=PoolReading.Status.SUBMITTED
         )
 
+    @staticmethod
+    async def _create_reading(data: PoolReadingData, user: User) -> PoolReading:
+        """
+        Create a new pool reading in the database.
+
+        Args:
+            data: The pool reading data
+            user: The user submitting the reading
+
+        Returns:
+            The created PoolReading instance
+        """
+        reading = PoolReadingService._build_reading(data, user)
+        await reading.asave(force_insert=True)
+        return reading
+
     @staticmethod
     async def get_reading_by_reference(
         reference_id: str
@@ -180,7 +266,7 @@ class PoolReadingService:
         """
         try:
             # Validate status
-            if new_status not in dict(PoolReading.Status.choices):
+            if new_status not in VALID_STATUSES:
                 raise ValueError(f"Invalid status: {new_status}")
 
             reading.status = new_status
@@ -6,6 +6,8 @@ from config.app_config import get_navigation_path
 ROUTE_LOGIN = get_navigation_path('/')
 ROUTE_SUBMISSIONS = get_navigation_path('/submissions')
 ROUTE_FORM_NEW = get_navigation_path('/form')
+ROUTE_POOL = get_navigation_path('/pool')
+ROUTE_FORM_VIEW = get_navigation_path('/form/{ref_id}')
 
 def get_form_view_route(ref_id: str) -> str:
     """Get the route for viewing/editing a form by reference ID."""
@@ -1,18 +1,27 @@
 """Pool reading form UI component for creating and editing pool inspections."""
 
-from dataclasses import dataclass
 from typing import Optional
 import logging
+import operator
 
 from asgiref.sync import sync_to_async
-from nicegui import ui
+from nicegui import binding, ui
 
 from models import User, PoolReading
 from services.pool_reading_service import (
-    submit_pool_reading,
+    PoolReadingData,
+    PoolReadingService,
     PoolReadingSubmissionResult
 )
 from ui.navigation import ROUTE_SUBMISSIONS, ROUTE_FORM_NEW
+from ui.submissions_dashboard import (
+    PENDING_MESSAGE,
+    STATUS_LABELS,
+    WATER_CLARITY_LABELS,
+    add_pending_submission,
+    confirm_pending_submission,
+    discard_pending_submission
+)
 
 
 logger = logging.getLogger(__name__)
@@ -42,9 +51,14 @@ TEMPERATURE_STEP = 0.1
 READONLY_STATUSES = {'in_progress', 'completed'}
 
 
-@dataclass
+@binding.bindable_dataclass
 class FormState:
-    """Type-safe form state for pool reading data."""
+    """
+    Type-safe form state for pool reading data.
+
+    Fields are NiceGUI bindable properties, so assignments are pushed to the
+    bound elements right away instead of waiting for the binding poll loop.
+    """
     hotel: str = ''
     status: str = 'open'
     ph_level: float = DEFAULT_PH_LEVEL
@@ -56,21 +70,6 @@ class FormState:
     is_readonly: bool = False
     is_existing: bool = False
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for UI binding."""
-        return {
-            'hotel': self.hotel,
-            'status': self.status,
-            'ph_level': self.ph_level,
-            'chlorine_ppm': self.chlorine_ppm,
-            'alkalinity_ppm': self.alkalinity_ppm,
-            'temperature_celsius': self.temperature_celsius,
-            'water_clarity': self.water_clarity,
-            'notes': self.notes,
-            'is_readonly': self.is_readonly,
-            'is_existing': self.is_existing,
-        }
-
 
 class PoolFormComponent:
     """Component for rendering the pool inspection form."""
@@ -85,32 +84,38 @@ class PoolFormComponent:
         """
         self.user = user
         self.reading_ref_id = reading_ref_id
-        self.state: dict = FormState().to_dict()
+        self.state = FormState()
 
     async def load_data(self) -> None:
         """Load form data from database if editing existing reading."""
+        # Load existing reading data; its select_related hotel supplies the
+        # hotel name, so the user's hotel is only looked up for new forms
+        if self.reading_ref_id:
+            try:
+                reading = await self._fetch_reading_from_db()
+                self._populate_state_from_reading(reading)
+                return
+            except PoolReading.DoesNotExist:
+                logger.error(f"Reading not found: {self.reading_ref_id}")
+                ui.notify(
+                    f'Reading {self.reading_ref_id} not found',
+                    type='negative'
+                )
+
         # Load hotel name for the current user
-        self.state['hotel'] = await self._get_user_hotel_name()
+        self.state.hotel = await self._get_user_hotel_name()
 
-        # If no reference ID, this is a new form
-        if not self.reading_ref_id:
-            return
+    async def _get_user_hotel_name(self) -> str:
+        """Get the hotel name for the current user."""
+        if self.user.hotel_id is None:
+            return ''
 
-        # Load existing reading data
-        try:
-            reading = await self._fetch_reading_from_db()
-            self._populate_state_from_reading(reading)
-        except PoolReading.DoesNotExist:
-            logger.error(f"Reading not found: {self.reading_ref_id}")
-            ui.notify(
-                f'Reading {self.reading_ref_id} not found',
-                type='negative'
-            )
+        # The session user is loaded with select_related('hotel'), so this is
+        # normally answered without leaving the event loop
+        if User.hotel.is_cached(self.user):
+            return self.user.hotel.name
 
-    @sync_to_async
-    def _get_user_hotel_name(self) -> str:
-        """Get the hotel name for the current user."""
-        return self.user.hotel.name if self.user.hotel else ''
+        return await sync_to_async(lambda: self.user.hotel.name)()
 
     async def _fetch_reading_from_db(self) -> PoolReading:
         """Fetch reading from database by reference ID."""
@@ -119,19 +124,17 @@ class PoolFormComponent:
         )
 
     def _populate_state_from_reading(self, reading: PoolReading) -> None:
-        """Populate form state from database reading."""
-        self.state.update({
-            'hotel': reading.hotel.name,
-            'status': reading.status,
-            'ph_level': float(reading.ph_level),
-            'chlorine_ppm': float(reading.chlorine_ppm),
-            'alkalinity_ppm': reading.alkalinity_ppm,
-            'temperature_celsius': float(reading.temperature_celsius),
-            'water_clarity': reading.water_clarity,
-            'notes': reading.notes,
-            'is_existing': True,
-            'is_readonly': reading.status in READONLY_STATUSES
-        })
+        """Populate form state from database reading in one uninterrupted block."""
+        self.state.hotel = reading.hotel.name
+        self.state.status = reading.status
+        self.state.ph_level = float(reading.ph_level)
+        self.state.chlorine_ppm = float(reading.chlorine_ppm)
+        self.state.alkalinity_ppm = reading.alkalinity_ppm
+        self.state.temperature_celsius = float(reading.temperature_celsius)
+        self.state.water_clarity = reading.water_clarity
+        self.state.notes = reading.notes
+        self.state.is_existing = True
+        self.state.is_readonly = reading.status in READONLY_STATUSES
 
     async def handle_submit(self, msg_label: ui.label) -> None:
         """
@@ -140,32 +143,73 @@ class PoolFormComponent:
         Args:
             msg_label: UI label to display submission result
         """
-        result = await self._submit_form()
+        # Validate before anything is shown as pending
+        try:
+            data = self._build_reading_data()
+        except ValueError as e:
+            self._handle_error(
+                PoolReadingSubmissionResult(
+                    success=False,
+                    message=f"Doğrulama hatası: {str(e)}"
+                ),
+                msg_label
+            )
+            return
+
+        # Optimistic update: list the reading on the dashboard before the save completes.
+        # The reading is saved under the submitter's hotel, which differs from
+        # state.hotel when an admin submits from another hotel's reading.
+        pending_row = add_pending_submission(
+            self.user,
+            hotel_name=await self._get_user_hotel_name(),
+            ph_level=data.ph_level,
+            chlorine_ppm=data.chlorine_ppm,
+            water_clarity=data.water_clarity
+        )
+        msg_label.text = PENDING_MESSAGE
+
+        result = None
+        try:
+            result = await self._submit_form(data)
+        finally:
+            # Never leave the provisional row behind, even if the submit raised
+            if result is not None and result.success:
+                confirm_pending_submission(self.user, pending_row, result.reading)
+            else:
+                discard_pending_submission(self.user, pending_row)
 
         if result.success:
             self._handle_success(result, msg_label)
         else:
             self._handle_error(result, msg_label)
 
-    async def _submit_form(self) -> PoolReadingSubmissionResult:
-        """Submit form data to the backend service."""
-        return await submit_pool_reading(
-            ph_level=self.state['ph_level'],
-            chlorine_ppm=self.state['chlorine_ppm'],
-            alkalinity_ppm=self.state['alkalinity_ppm'],
-            temperature_celsius=self.state['temperature_celsius'],
-            water_clarity=self.state['water_clarity'],
-            notes=self.state['notes'],
-            user=self.user,
+    def _build_reading_data(self) -> PoolReadingData:
+        """
+        Build the validated submission data from the form state.
+
+        Raises:
+            pydantic.ValidationError: If a value is missing or out of range
+        """
+        return PoolReadingData(
+            ph_level=self.state.ph_level,
+            chlorine_ppm=self.state.chlorine_ppm,
+            alkalinity_ppm=self.state.alkalinity_ppm,
+            temperature_celsius=self.state.temperature_celsius,
+            water_clarity=self.state.water_clarity,
+            notes=self.state.notes
         )
 
+    async def _submit_form(self, data: PoolReadingData) -> PoolReadingSubmissionResult:
+        """Submit validated form data to the backend service."""
+        return await PoolReadingService.submit_reading(data, self.user)
+
     def _handle_success(
         self,
         result: PoolReadingSubmissionResult,
         msg_label: ui.label
     ) -> None:
         """Handle successful form submission."""
-        self.state['status'] = 'submitted'
+        self.state.status = 'submitted'
         msg_label.text = f"✓ Başarılı! Referans: {result.reference_id}"
         msg_label.classes('text-green-600')
         logger.info(f"Form submitted successfully: {result.reference_id}")
@@ -215,7 +259,7 @@ class PoolFormComponent:
         ui.label('Gönderim Durumu').classes('text-h6 mt-4 mb-2')
 
         status_select = ui.select(
-            options=dict(PoolReading.Status.choices),
+            options=STATUS_LABELS,
             label='Durum'
         ).bind_value(self.state, 'status').classes('w-full')
 
@@ -299,7 +343,7 @@ class PoolFormComponent:
         ).bind_value(
             self.state, key
         ).bind_enabled_from(
-            self.state, 'is_readonly', backward=lambda x: not x
+            self.state, 'is_readonly', backward=operator.not_
         ).classes('flex-1')
 
     def _render_water_quality(self) -> None:
@@ -307,12 +351,12 @@ class PoolFormComponent:
         ui.label('Su Kalitesi').classes('text-h6 mt-6 mb-2')
 
         ui.select(
-            options=dict(PoolReading.WaterClarity.choices),
+            options=WATER_CLARITY_LABELS,
             label='Su Berraklığı'
         ).bind_value(
             self.state, 'water_clarity'
         ).bind_enabled_from(
-            self.state, 'is_readonly', backward=lambda x: not x
+            self.state, 'is_readonly', backward=operator.not_
         ).classes('w-full')
 
     def _render_notes(self) -> None:
@@ -322,14 +366,14 @@ class PoolFormComponent:
         ui.textarea('Notlar').bind_value(
             self.state, 'notes'
         ).bind_enabled_from(
-            self.state, 'is_readonly', backward=lambda x: not x
+            self.state, 'is_readonly', backward=operator.not_
         ).classes('w-full')
 
     def _render_actions(self) -> None:
         """Render the form action buttons."""
         message_label = ui.label('').classes('w-full text-center mt-4 font-bold')
 
-        show_submit = (not self.state['is_readonly']) or self.user.is_admin
+        show_submit = (not self.state.is_readonly) or self.user.is_admin
 
         if show_submit:
             ui.button(
@@ -1,13 +1,19 @@
 """Submissions dashboard page component with table, navigation, and search."""
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Optional, TypedDict
+import itertools
 import logging
+import time
 
+from asgiref.sync import sync_to_async
+from django.db.models import CharField, Count, F, Func, Q, QuerySet, Value
+from django.db.models.functions import Cast
 from nicegui import ui
 
-from models import User, PoolReading
+from models import User, Hotel, PoolReading
 from ui.navigation import ROUTE_SUBMISSIONS, ROUTE_FORM_NEW, get_form_view_route
 
 
@@ -16,13 +22,85 @@ logger = logging.getLogger(__name__)
 
 # Constants
 CACHE_TTL_SECONDS = 60  # 1 minute cache
+CACHE_MAX_ENTRIES = 256
+ADMIN_CACHE_SCOPE = 'admin'  # Admins all see every reading, so they share cached pages
 TABLE_ROWS_PER_PAGE = 10
-DATE_FORMAT = '%Y-%m-%d %H:%M'
-
+SEARCH_DEBOUNCE_MS = 300
+FETCH_PAGE_SIZE = 100  # Rows loaded from the database per "load more"
+PREWARM_USER_LIMIT = 20
+PREWARM_INTERVAL_SECONDS = CACHE_TTL_SECONDS - 10  # Reload prewarmed pages before they expire
+DATE_FORMAT = 'YYYY-MM-DD HH24:MI'  # PostgreSQL TO_CHAR pattern
+PENDING_DATE_FORMAT = '%Y-%m-%d %H:%M'  # strftime equivalent of DATE_FORMAT
+PENDING_MESSAGE = 'Gönderiliyor...'  # Shown while a submission is being saved
+
+# Display labels for the raw choice values, also the pool form's select options
+STATUS_LABELS = dict(PoolReading.Status.choices)
+WATER_CLARITY_LABELS = dict(PoolReading.WaterClarity.choices)
+
+# Table columns configuration, shared by every dashboard render
+TABLE_COLUMNS = [
+    {
+        'name': 'reference_id',
+        'label': 'Referans No',
+        'field': 'reference_id',
+        'align': 'left',
+        'sortable': True
+    },
+    {
+        'name': 'hotel_name',
+        'label': 'Otel',
+        'field': 'hotel_name',
+        'align': 'left',
+        'sortable': True
+    },
+    {
+        'name': 'submitted_by',
+        'label': 'Gönderen',
+        'field': 'submitted_by',
+        'align': 'left',
+        'sortable': True
+    },
+    {
+        'name': 'submission_date',
+        'label': 'Tarih',
+        'field': 'submission_date',
+        'align': 'left',
+        'sortable': True
+    },
+    {
+        'name': 'status',
+        'label': 'Durum',
+        'field': 'status',
+        'align': 'left',
+        'sortable': True
+    },
+    {
+        'name': 'ph_level',
+        'label': 'pH',
+        'field': 'ph_level',
+        'align': 'left'
+    },
+    {
+        'name': 'chlorine_ppm',
+        'label': 'Klor (ppm)',
+        'field': 'chlorine_ppm',
+        'align': 'left'
+    },
+    {
+        'name': 'water_clarity',
+        'label': 'Su Berraklığı',
+        'field': 'water_clarity',
+        'align': 'left'
+    },
+]
+
+
+class SubmissionRow(TypedDict):
+    """
+    Type-safe representation of a submission row in the dashboard table.
 
-@dataclass
-class SubmissionRow:
-    """Type-safe representation of a submission row in the dashboard table."""
+    Rows are plain dicts, so cached rows are handed to the NiceGUI table as-is.
+    """
     id: int
     reference_id: str
     hotel_name: str
@@ -33,60 +111,100 @@ class SubmissionRow:
     chlorine_ppm: float
     water_clarity: str
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for NiceGUI table."""
-        return {
-            'id': self.id,
-            'reference_id': self.reference_id,
-            'hotel_name': self.hotel_name,
-            'submitted_by': self.submitted_by,
-            'submission_date': self.submission_date,
-            'status': self.status,
-            'ph_level': self.ph_level,
-            'chlorine_ppm': self.chlorine_ppm,
-            'water_clarity': self.water_clarity,
-        }
+
+# (submission_date, id) of the last row shown; the next page starts after it
+Cursor = tuple[datetime, int]
+
+# Whose pages a cache entry holds: a user id, or ADMIN_CACHE_SCOPE for all admins
+CacheScope = int | str
+
+
+@dataclass
+class SubmissionsPage:
+    """One keyset-paginated page of dashboard rows."""
+    rows: list[SubmissionRow]
+    next_cursor: Optional[Cursor] = None  # Set if more rows follow
 
 
 class SubmissionsCache:
-    """Simple in-memory cache for submissions data."""
+    """In-memory cache of submission pages per scope and search term, evicting the least recently used page."""
 
-    def __init__(self, ttl_seconds: int = CACHE_TTL_SECONDS):
-        self._data: Optional[list[SubmissionRow]] = None
-        self._timestamp: Optional[datetime] = None
-        self._user_id: Optional[int] = None
+    def __init__(self, ttl_seconds: int = CACHE_TTL_SECONDS, max_entries: int = CACHE_MAX_ENTRIES):
+        self._entries: OrderedDict[
+            tuple[CacheScope, str, Optional[Cursor]], tuple[float, SubmissionsPage]
+        ] = OrderedDict()
         self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+
+    def get(
+        self,
+        scope: CacheScope,
+        search: str = '',
+        cursor: Optional[Cursor] = None
+    ) -> Optional[SubmissionsPage]:
+        """Get the cached page for search starting after cursor if valid for the given scope."""
+        key = (scope, search, cursor)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
 
-    def get(self, user_id: int) -> Optional[list[SubmissionRow]]:
-        """Get cached data if valid for the given user."""
-        if not self._is_valid(user_id):
+        cached_at, data = entry
+        cache_age = time.monotonic() - cached_at
+        if cache_age >= self._ttl_seconds:
             return None
 
-        cache_age = (datetime.now() - self._timestamp).total_seconds()
+        self._entries.move_to_end(key)
         logger.info(f"✓ Cache HIT - Using cached data (age: {cache_age:.1f}s)")
-        return self._data
-
-    def set(self, user_id: int, data: list[SubmissionRow]) -> None:
-        """Update cache with new data."""
-        self._data = data
-        self._timestamp = datetime.now()
-        self._user_id = user_id
-        logger.info(f"Cache updated for user {user_id}")
-
-    def invalidate(self) -> None:
-        """Clear the cache."""
-        self._data = None
-        self._timestamp = None
-        self._user_id = None
+        return data
+
+    def set(
+        self,
+        scope: CacheScope,
+        data: SubmissionsPage,
+        search: str = '',
+        cursor: Optional[Cursor] = None
+    ) -> None:
+        """Update cache with the page for search starting after cursor for the given scope."""
+        key = (scope, search, cursor)
+        self._entries[key] = (time.monotonic(), data)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        logger.info(f"Cache updated for {scope}")
+
+    def invalidate(
+        self,
+        scope: Optional[CacheScope] = None,
+        except_scope: Optional[CacheScope] = None
+    ) -> None:
+        """
+        Clear cached pages.
+
+        Args:
+            scope: Only clear this scope's pages; clears every scope if None
+            except_scope: Keep this scope's pages when clearing every scope
+        """
+        if scope is None and except_scope is None:
+            self._entries.clear()
+        else:
+            stale_keys = [
+                key for key in self._entries
+                if key[0] != except_scope and scope in (None, key[0])
+            ]
+            for key in stale_keys:
+                del self._entries[key]
         logger.info("Cache invalidated")
 
-    def _is_valid(self, user_id: int) -> bool:
-        """Check if cache is valid for the given user."""
-        if self._data is None or self._timestamp is None or self._user_id != user_id:
-            return False
 
-        age = (datetime.now() - self._timestamp).total_seconds()
-        return age < self._ttl_seconds
+def get_cache_scope(user: User) -> CacheScope:
+    """Get the cache scope holding the dashboard pages a user sees."""
+    return ADMIN_CACHE_SCOPE if user.is_admin else user.id
+
+
+def _get_matching_choices(labels: dict[str, str], search: str) -> list[str]:
+    """Get the raw choice values whose display label contains the search term."""
+    term = search.casefold()
+    return [value for value, label in labels.items() if term in label.casefold()]
 
 
 class SubmissionsDashboardComponent:
@@ -95,133 +213,245 @@ class SubmissionsDashboardComponent:
     def __init__(self, user: User, cache: SubmissionsCache):
         self.user = user
         self.cache = cache
+        self.cache_scope = get_cache_scope(user)
         self.table: Optional[ui.table] = None
-
-    async def load_submissions(self, force_refresh: bool = False) -> list[SubmissionRow]:
+        self.load_more_button: Optional[ui.button] = None
+        self.next_cursor: Optional[Cursor] = None
+        self.search_term = ''
+        self._rows_signature: Optional[int] = None
+
+    async def load_submissions(
+        self,
+        force_refresh: bool = False,
+        cursor: Optional[Cursor] = None
+    ) -> SubmissionsPage:
         """
-        Load pool submissions from database with caching.
+        Load a page of pool submissions matching the current search from database with caching.
 
         Args:
             force_refresh: If True, bypass cache and fetch from database
+            cursor: (submission_date, id) of the last row already shown, or None for the first page
 
         Returns:
-            List of submission rows
+            Page of submission rows
         """
+        search = self.search_term
+
         # Check cache first
         if not force_refresh:
-            cached_data = self.cache.get(self.user.id)
+            cached_data = self.cache.get(self.cache_scope, search, cursor)
             if cached_data is not None:
                 return cached_data
 
         # Cache miss - fetch from database
         logger.info("✗ Cache MISS - Fetching from database")
-        submissions = await self._fetch_from_database()
+        submissions = await self._fetch_from_database(search, cursor)
 
         # Update cache
-        self.cache.set(self.user.id, submissions)
+        self.cache.set(self.cache_scope, submissions, search, cursor)
 
         return submissions
 
-    async def _fetch_from_database(self) -> list[SubmissionRow]:
-        """Fetch submissions from database based on user permissions."""
-        # Build query based on user permissions
-        queryset = PoolReading.objects.select_related('submitted_by', 'hotel')
+    async def _fetch_from_database(
+        self,
+        search: str = '',
+        cursor: Optional[Cursor] = None
+    ) -> SubmissionsPage:
+        """Fetch one page of submissions from database based on user permissions and search."""
+        # Build query based on user permissions, fetching only the rendered columns
+        queryset = PoolReading.objects.all()
 
         if not self.user.is_admin:
             queryset = queryset.filter(hotel_id=self.user.hotel_id)
 
-        # Convert to typed rows
-        submissions = []
-        async for reading in queryset:
-            submission = SubmissionRow(
-                id=reading.id,
-                reference_id=reading.reference_id,
-                hotel_name=reading.hotel.name,
-                submitted_by=reading.submitted_by.username,
-                submission_date=reading.submission_date.strftime(DATE_FORMAT),
-                status=reading.get_status_display(),
-                ph_level=float(reading.ph_level),
-                chlorine_ppm=float(reading.chlorine_ppm),
-                water_clarity=reading.get_water_clarity_display()
+        # Format the date in the database rather than per row in Python
+        queryset = queryset.annotate(
+            submission_date_display=Func(
+                F('submission_date'),
+                Value(DATE_FORMAT),
+                function='TO_CHAR',
+                output_field=CharField()
+            )
+        )
+
+        # Search before slicing, so matches beyond the loaded rows are found too
+        if search:
+            queryset = queryset.annotate(
+                ph_level_text=Cast('ph_level', output_field=CharField()),
+                chlorine_ppm_text=Cast('chlorine_ppm', output_field=CharField())
+            ).filter(self._get_search_filter(search))
+
+        queryset = queryset.order_by('-submission_date', '-id')
+
+        # Keyset pagination: continue strictly after the cursor row in (date, id) order
+        if cursor is not None:
+            cursor_date, cursor_id = cursor
+            queryset = queryset.filter(
+                Q(submission_date__lt=cursor_date)
+                | Q(submission_date=cursor_date, id__lt=cursor_id)
             )
-            submissions.append(submission)
 
-        return submissions
+        queryset = queryset.values(
+            'id',
+            'reference_id',
+            'hotel_id',
+            'submitted_by_id',
+            'submission_date',
+            'submission_date_display',
+            'status',
+            'ph_level',
+            'chlorine_ppm',
+            'water_clarity',
+        )[:FETCH_PAGE_SIZE + 1]  # One extra row tells whether another page follows
+
+        return await self._collect_page(queryset)
+
+    @staticmethod
+    def _get_search_filter(search: str) -> Q:
+        """
+        Build the filter matching a search term against every displayed column.
+
+        Statuses and water clarities are stored as raw choice values, so the
+        term is also matched against their display labels. Expects the text
+        annotations added by _fetch_from_database.
+        """
+        return (
+            Q(reference_id__icontains=search)
+            | Q(hotel__name__icontains=search)
+            | Q(submitted_by__username__icontains=search)
+            | Q(submission_date_display__icontains=search)
+            | Q(status__icontains=search)
+            | Q(status__in=_get_matching_choices(STATUS_LABELS, search))
+            | Q(ph_level_text__icontains=search)
+            | Q(chlorine_ppm_text__icontains=search)
+            | Q(water_clarity__icontains=search)
+            | Q(water_clarity__in=_get_matching_choices(WATER_CLARITY_LABELS, search))
+        )
+
+    @sync_to_async
+    def _collect_page(self, queryset: QuerySet) -> SubmissionsPage:
+        """
+        Convert query results to a page of typed rows in a single worker-thread hop.
+
+        Hotel and submitter names are resolved from small id-to-name maps rather
+        than joined onto every row, since a page repeats the same few of each.
+        """
+        readings = list(queryset)
+
+        # The query asks for one extra row to tell whether another page follows
+        next_cursor = None
+        if len(readings) > FETCH_PAGE_SIZE:
+            readings.pop()
+            next_cursor = (readings[-1]['submission_date'], readings[-1]['id'])
+
+        if not readings:
+            return SubmissionsPage([])
+
+        usernames = dict(
+            User.objects.filter(
+                id__in={reading['submitted_by_id'] for reading in readings}
+            ).values_list('id', 'username')
+        )
+
+        if self.user.is_admin:
+            hotel_names = dict(
+                Hotel.objects.filter(
+                    id__in={reading['hotel_id'] for reading in readings}
+                ).values_list('id', 'name')
+            )
+        else:
+            # Non-admins only see their own hotel, already loaded with the user
+            hotel_names = {self.user.hotel_id: self.user.hotel.name}
+
+        rows = [
+            SubmissionRow(
+                id=reading['id'],
+                reference_id=reading['reference_id'],
+                hotel_name=hotel_names.get(reading['hotel_id'], ''),
+                submitted_by=usernames.get(reading['submitted_by_id'], ''),
+                submission_date=reading['submission_date_display'],
+                status=STATUS_LABELS.get(reading['status'], reading['status']),
+                ph_level=float(reading['ph_level']),
+                chlorine_ppm=float(reading['chlorine_ppm']),
+                water_clarity=WATER_CLARITY_LABELS.get(
+                    reading['water_clarity'], reading['water_clarity']
+                )
+            )
+            for reading in readings
+        ]
+        return SubmissionsPage(rows, next_cursor)
 
     async def refresh_table(self, force: bool = False) -> None:
-        """Refresh the table data."""
+        """Refresh the table data with the first page of submissions."""
         if self.table is None:
             logger.warning("Cannot refresh table - table not initialized")
             return
 
-        submissions = await self.load_submissions(force_refresh=force)
-        self.table.rows = [s.to_dict() for s in submissions]
-        self.table.update()
+        if force:
+            # Later pages were cut relative to the old first page, drop them too
+            self.cache.invalidate(self.cache_scope)
+
+        search = self.search_term
+        page = await self.load_submissions(force_refresh=force)
+        if search != self.search_term:
+            return  # A newer search replaced this one while it was loading
+
+        self._set_next_cursor(page.next_cursor)
+
+        # Leave the table alone when nothing changed since the last render
+        signature = self._get_rows_signature(page.rows)
+        if signature == self._rows_signature:
+            return
+
+        # Assigning the prop queues the table update; NiceGUI serializes it once per flush
+        self.table.rows = page.rows
+        self._rows_signature = signature
+
+    async def load_more(self) -> None:
+        """Append the next page of submissions to the table."""
+        if self.table is None or self.next_cursor is None:
+            return
+
+        search = self.search_term
+        page = await self.load_submissions(cursor=self.next_cursor)
+        if search != self.search_term:
+            return
+
+        self.table.rows = self.table.rows + page.rows
+        self._rows_signature = self._get_rows_signature(self.table.rows)
+        self._set_next_cursor(page.next_cursor)
+
+    async def search(self, term: Optional[str]) -> None:
+        """Reload the table with the submissions matching a new search term."""
+        term = (term or '').strip()
+        if term == self.search_term:
+            return
+
+        self.search_term = term
+        await self.refresh_table()
+
+    @staticmethod
+    def _get_rows_signature(rows: list[SubmissionRow]) -> int:
+        """Hash the displayed values of the rows to detect unchanged refreshes."""
+        return hash(tuple(tuple(row.values()) for row in rows))
+
+    def _set_next_cursor(self, cursor: Optional[Cursor]) -> None:
+        """Remember where the next page starts and show the load-more button if any."""
+        self.next_cursor = cursor
+        if self.load_more_button is not None:
+            self.load_more_button.set_visibility(cursor is not None)
 
     def _handle_row_click(self, event) -> None:
         """Handle table row click event."""
         row_data = event.args[1]
+
+        # Provisional rows have no saved reading to open yet
+        if row_data['id'] < 0:
+            return
+
         reference_id = row_data['reference_id']
         ui.navigate.to(get_form_view_route(reference_id))
 
-    def _get_table_columns(self) -> list[dict]:
-        """Define table columns configuration."""
-        return [
-            {
-                'name': 'reference_id',
-                'label': 'Referans No',
-                'field': 'reference_id',
-                'align': 'left',
-                'sortable': True
-            },
-            {
-                'name': 'hotel_name',
-                'label': 'Otel',
-                'field': 'hotel_name',
-                'align': 'left',
-                'sortable': True
-            },
-            {
-                'name': 'submitted_by',
-                'label': 'Gönderen',
-                'field': 'submitted_by',
-                'align': 'left',
-                'sortable': True
-            },
-            {
-                'name': 'submission_date',
-                'label': 'Tarih',
-                'field': 'submission_date',
-                'align': 'left',
-                'sortable': True
-            },
-            {
-                'name': 'status',
-                'label': 'Durum',
-                'field': 'status',
-                'align': 'left',
-                'sortable': True
-            },
-            {
-                'name': 'ph_level',
-                'label': 'pH',
-                'field': 'ph_level',
-                'align': 'left'
-            },
-            {
-                'name': 'chlorine_ppm',
-                'label': 'Klor (ppm)',
-                'field': 'chlorine_ppm',
-                'align': 'left'
-            },
-            {
-                'name': 'water_clarity',
-                'label': 'Su Berraklığı',
-                'field': 'water_clarity',
-                'align': 'left'
-            },
-        ]
-
     def _render_navbar(self) -> None:
         """Render the top navigation bar."""
         with ui.header().classes('bg-blue-600 text-white p-4'):
@@ -250,13 +480,16 @@ class SubmissionsDashboardComponent:
             f'Giriş yapan: {self.user.username} ({user_role})'
         ).classes('text-subtitle1 mb-6 text-gray-600')
 
-    def _render_table(self) -> None:
-        """Render the submissions table."""
-        columns = self._get_table_columns()
+    def _render_table(self, page: SubmissionsPage) -> None:
+        """
+        Render the submissions table.
 
+        Args:
+            page: The first page of rows to show
+        """
         self.table = ui.table(
-            columns=columns,
-            rows=[],
+            columns=TABLE_COLUMNS,
+            rows=page.rows,
             row_key='id',
             pagination={
                 'rowsPerPage': TABLE_ROWS_PER_PAGE,
@@ -265,30 +498,129 @@ class SubmissionsDashboardComponent:
             },
         ).classes('w-full')
 
+        self._rows_signature = self._get_rows_signature(page.rows)
         self.table.on('rowClick', self._handle_row_click)
 
         # Add search filter
         with self.table.add_slot('top-left'):
+            # Searched in the database so readings beyond the loaded rows are found;
+            # debounced so the query runs once typing pauses, not per keystroke
             ui.input(
                 'Ara',
-                placeholder='Otel, kullanıcı veya duruma göre ara...'
-            ).classes('w-64').bind_value(self.table, 'filter')
+                placeholder='Referans, otel, kullanıcı veya duruma göre ara...',
+                on_change=lambda e: self.search(e.value)
+            ).props(f'debounce={SEARCH_DEBOUNCE_MS}').classes('w-64')
+
+        self.load_more_button = ui.button(
+            'Daha Fazla Yükle',
+            icon='expand_more',
+            on_click=self.load_more
+        ).props('flat').classes('self-center')
+        self._set_next_cursor(page.next_cursor)
 
     async def render(self) -> None:
         """Render the complete submissions table page."""
+        # Load initial data so the table is built with its rows in place
+        page = await self.load_submissions()
+
         self._render_navbar()
 
         with ui.column().classes('w-full p-8'):
             self._render_header()
-            self._render_table()
-
-            # Load initial data
-            ui.timer(0.1, lambda: self.refresh_table(), once=True)
+            self._render_table(page)
 
 
 # Global cache instance
 _cache = SubmissionsCache()
 
+# Placeholder ids for provisional rows, kept clear of real primary keys
+_pending_row_ids = itertools.count(-1, -1)
+
+
+def add_pending_submission(
+    user: User,
+    hotel_name: str,
+    ph_level: float,
+    chlorine_ppm: float,
+    water_clarity: str
+) -> Optional[SubmissionRow]:
+    """
+    Optimistically show a submission that is still being saved.
+
+    The row is put at the top of the user's cached first dashboard page, shared
+    by all admins for an admin, so it is there even if they open the dashboard
+    before the save completes.
+
+    Args:
+        user: The submitting user
+        hotel_name: Name of the user's hotel
+        ph_level: Submitted pH level
+        chlorine_ppm: Submitted free chlorine
+        water_clarity: Submitted raw water clarity value
+
+    Returns:
+        The provisional row to confirm or discard later, or None if the user
+        has no cached first page
+    """
+    page = _cache.get(get_cache_scope(user))
+    if page is None:
+        return None
+
+    row = SubmissionRow(
+        id=next(_pending_row_ids),
+        reference_id=PENDING_MESSAGE,
+        hotel_name=hotel_name,
+        submitted_by=user.username,
+        submission_date=datetime.now(timezone.utc).strftime(PENDING_DATE_FORMAT),
+        status=STATUS_LABELS[PoolReading.Status.SUBMITTED],
+        ph_level=float(ph_level),
+        chlorine_ppm=float(chlorine_ppm),
+        water_clarity=WATER_CLARITY_LABELS.get(water_clarity, water_clarity)
+    )
+    page.rows.insert(0, row)
+    return row
+
+
+def confirm_pending_submission(
+    user: User,
+    row: Optional[SubmissionRow],
+    reading: PoolReading
+) -> None:
+    """
+    Replace a provisional row's placeholders with the saved reading's values.
+
+    A new reading shows up for its submitter, their hotel colleagues and all
+    admins, so every other scope's cached pages are cleared.
+
+    Args:
+        user: The submitting user
+        row: The row returned by add_pending_submission
+        reading: The saved reading
+    """
+    if row is None:
+        _cache.invalidate()
+        return
+
+    row['id'] = reading.id
+    row['reference_id'] = reading.reference_id
+    _cache.invalidate(except_scope=get_cache_scope(user))
+
+
+def discard_pending_submission(user: User, row: Optional[SubmissionRow]) -> None:
+    """
+    Remove a provisional row after its submission failed.
+
+    Args:
+        user: The submitting user
+        row: The row returned by add_pending_submission
+    """
+    if row is None:
+        return
+
+    page = _cache.get(get_cache_scope(user))
+    if page is not None:
+        page.rows[:] = [r for r in page.rows if r is not row]
+
 
 async def render_submissions_dashboard(user: User) -> None:
     """
@@ -301,3 +633,33 @@ async def render_submissions_dashboard(user: User) -> None:
     """
     component = SubmissionsDashboardComponent(user, _cache)
     await component.render()
+
+
+async def prewarm_submissions_cache(user_limit: int = PREWARM_USER_LIMIT) -> None:
+    """
+    Reload the first dashboard page for admins and the most active submitters.
+
+    Intended to run every PREWARM_INTERVAL_SECONDS from startup, so the pages
+    are reloaded before they expire and their dashboard visits are always
+    served from memory. Admins share one page, so it is loaded once.
+
+    Args:
+        user_limit: Maximum number of users to prewarm
+    """
+    users = User.objects.select_related('hotel').annotate(
+        reading_count=Count('poolreading')
+    ).order_by('-is_admin', '-reading_count')[:user_limit]
+
+    try:
+        # One thread hop for the whole user list rather than one per row
+        users = await sync_to_async(list)(users)
+        prewarmed_scopes = set()
+        for user in users:
+            component = SubmissionsDashboardComponent(user, _cache)
+            if component.cache_scope in prewarmed_scopes:
+                continue
+            await component.load_submissions(force_refresh=True)
+            prewarmed_scopes.add(component.cache_scope)
+        logger.info(f"Submissions cache prewarmed for {len(prewarmed_scopes)} scopes")
+    except Exception as e:
+        logger.error(f"Error prewarming submissions cache: {e}", exc_info=True)